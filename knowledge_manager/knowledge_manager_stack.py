@@ -14,12 +14,13 @@ The DynamoDB table (AppBehaviourTable) has:
 
 The DynamoDB table (UserLongTermMemoryTable) has:
 - Partition Key: user_id (STRING)
-- Sort key: timestamp (NUMBER)
-- Additional attribute: memory
+- Additional attributes: timestamp, memory, version
+- A single item per user, overwritten on each memory update; the version
+  counter makes concurrent updates fail instead of overwriting each other
 
 The Lambda function (ContextRetrieverLambda):
 - Is triggered by SNS notifications
-- Has access to read/write to the DynamoDB table
+- Has read access (GetItem) to the DynamoDB tables
 - Uses table name passed via environment variable
 
 The SNS topic (KnowledgeManager-ContextToBeRetrieved):
@@ -92,11 +93,16 @@ class KnowledgeManagerStack(AppCommonStack):
             },
         )
 
-        # Grant the Lambda function full access to the DynamoDB tables.
-        app_behaviour_table.grant_full_access(context_retriever_lambda)
-        user_long_term_memory_table.grant_read_data(context_retriever_lambda)
-        user_long_term_memory_table.grant_full_access(
-            user_long_term_memory_updater_lambda
+        # Grant the Lambda functions only the DynamoDB actions they use:
+        # point reads for the retriever, item reads/writes for the updater.
+        app_behaviour_table.grant(context_retriever_lambda, "dynamodb:GetItem")
+        user_long_term_memory_table.grant(
+            context_retriever_lambda, "dynamodb:GetItem"
+        )
+        user_long_term_memory_table.grant(
+            user_long_term_memory_updater_lambda,
+            "dynamodb:GetItem",
+            "dynamodb:PutItem",
         )
 
         # Create an SNS topic named "KnowledgeManager-ContextToBeRetrieved".
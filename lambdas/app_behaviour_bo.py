@@ -2,25 +2,30 @@
 This module contains the business logic for the AppBehaviour entity.
 """
 
-from functools import lru_cache
-from app_common.dynamodb_utils import DynamoDBBase
-from app_common.app_utils import http_request
+from dataclasses import asdict, dataclass
 
+from urllib3.exceptions import HTTPError
 
+from shared_clients import http_request
+from table_bo import TableBO
+from ttl_cache import TTLCache
+
+# Behaviours rarely change, so the resolved content is kept for a few minutes
+# per app, letting warm hits skip both DynamoDB and the HTTPS download.
+_BEHAVIOUR_CONTENT_CACHE = TTLCache(ttl=300)
+
+
+@dataclass(slots=True, frozen=True)
 class AppBehaviour:
     """
     Represents an AppBehaviour entity.
-    """
 
-    def __init__(self, app_id: str, behaviour_source: str) -> None:
-        """
-        Initializes an instance of the AppBehaviour class.
+    :param app_id: Identifier for the application.
+    :param behaviour_source: Source of the behaviour definition.
+    """
 
-        :param app_id: Identifier for the application.
-        :param behaviour_source: Source of the behaviour definition.
-        """
-        self.app_id = app_id
-        self.behaviour_source = behaviour_source
+    app_id: str
+    behaviour_source: str
 
     def to_dict(self) -> dict:
         """
@@ -28,13 +33,10 @@ class AppBehaviour:
 
         :return: Dictionary containing the AppBehaviour attributes.
         """
-        return {
-            "app_id": self.app_id,
-            "behaviour_source": self.behaviour_source,
-        }
+        return asdict(self)
 
 
-class AppBehaviourBO(DynamoDBBase):
+class AppBehaviourBO(TableBO):
     """
     Business object for managing AppBehaviour entities.
     """
@@ -46,18 +48,27 @@ class AppBehaviourBO(DynamoDBBase):
         :param app_id: Identifier for the application.
         :return: Content of the behaviour source as a string, or None if not found.
         """
+        cache_key = (self._table.name, app_id)
+        behaviour_content = _BEHAVIOUR_CONTENT_CACHE.get(cache_key)
+        if behaviour_content is not None:
+            return behaviour_content
+
         behaviour_source = self.get_behaviour_source(app_id)
         if not behaviour_source:
             return None
 
         if behaviour_source.startswith("http"):
             # The behaviour source is an HTTP URL, so we need to read its content.
-            return self._load_url_content_as_text(behaviour_source)
+            behaviour_content = self._load_url_content_as_text(behaviour_source)
+        else:
+            # Native behaviour Source: use it as is
+            behaviour_content = behaviour_source
 
-        # else: return as is (Native behaviour Source)
-        return behaviour_source
+        if behaviour_content:
+            _BEHAVIOUR_CONTENT_CACHE.set(cache_key, behaviour_content)
+
+        return behaviour_content
 
-    @lru_cache(maxsize=128)
     def get_behaviour_source(self, app_id: str) -> str:
         """
         Retrieves the behaviour source URL for the specified application.
@@ -65,18 +76,36 @@ class AppBehaviourBO(DynamoDBBase):
         :param app_id: Identifier for the application.
         :return: URL of the behaviour source, or None if not found.
         """
-        response = self.get_by_partition_key(pk_name="app_id", pk_value=app_id)
-        if not response:  # response is expected to be a list
+        # The table is keyed by app_id only, so a point read fetching just
+        # the needed attribute is enough.
+        response = self._table.get_item(
+            Key={"app_id": app_id},
+            ProjectionExpression="behaviour_source",
+        )
+        item = response.get("Item")
+        if not item:
             return None
 
-        return response[0].get("behaviour_source")
+        return item.get("behaviour_source")
 
     def _load_url_content_as_text(self, url: str) -> str:
         """
         Loads the content of the specified URL as text.
 
         :param url: URL to retrieve the content from.
-        :return: Content of the URL as a string, or None if not found.
+        :return: Content of the URL as a string, or None if not found or
+                 unreachable.
         """
-        response = http_request("GET", url)
+        try:
+            # The document is behaviour text whatever its Content-Type, so a
+            # JSON document is not decoded (nor rejected if malformed).
+            response = http_request("GET", url, decode_json=False)
+        except HTTPError:
+            # Connection errors, timeouts and redirect loops that outlasted
+            # the retries.
+            return None
+
+        if response["status_code"] >= 400:
+            return None
+
         return response.get("body")
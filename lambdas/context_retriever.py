@@ -13,6 +13,7 @@ The module exposes:
 
 Environment Variables:
     APP_BEHAVIOUR_TABLE_NAME: Name of the DynamoDB table containing app behaviours
+    USER_LONG_TERM_MEMORY_TABLE_NAME: Name of the DynamoDB table containing user memories
 
 Raises:
     ValueError: If app_id is missing or app behaviour cannot be found
@@ -20,17 +21,30 @@ Raises:
 
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 # Add `lambda/create/packages` to the system path.
 # This must be done before importing any modules from the `packages` directory.
-sys.path.append(os.path.join(os.path.dirname(__file__), "packages"))
+_PACKAGES_DIR = os.path.join(os.path.dirname(__file__), "packages")
+if _PACKAGES_DIR not in sys.path:
+    sys.path.append(_PACKAGES_DIR)
 
 from app_behaviour_bo import AppBehaviourBO
 from long_memory_bo import UserLongTermMemoryBO
-from app_common.base_lambda_handler import BaseLambdaHandler
+from reusable_handler import ReusableLambdaHandler
 
+# Worker threads for the independent lookups of ContextRetriever._handle.
+_EXECUTOR = ThreadPoolExecutor(max_workers=2)
 
-class ContextRetriever(BaseLambdaHandler):
+# Business objects shared by the invocations of this container.
+_APP_BEHAVIOUR_TABLE_NAME = os.environ["APP_BEHAVIOUR_TABLE_NAME"]
+_APP_BEHAVIOUR_BO = AppBehaviourBO(table_name=_APP_BEHAVIOUR_TABLE_NAME)
+_USER_LONG_TERM_MEMORY_BO = UserLongTermMemoryBO(
+    table_name=os.environ["USER_LONG_TERM_MEMORY_TABLE_NAME"]
+)
+
+
+class ContextRetriever(ReusableLambdaHandler):
     """
     A Lambda handler for retrieving context based on the provided app_id.
 
@@ -50,48 +64,40 @@ class ContextRetriever(BaseLambdaHandler):
         if not app_id:
             raise ValueError("app_id is required")
 
-        # Retrieve the AppBehaviour table name from the environment variables.
-        app_behaviour_table_name = self.get_env_var("APP_BEHAVIOUR_TABLE_NAME")
-        app_behaviour_bo = AppBehaviourBO(
-            table_name=app_behaviour_table_name
-            )
-
-        # Fetch the app behaviour content using the app_id.
-        app_behaviour = app_behaviour_bo.get_behaviour_content(app_id=app_id)
-
-        if not app_behaviour:
-            raise ValueError(f"AppBehaviour not found for app_id: {app_id}.\n"
-                             f"You must add it in the table `{app_behaviour_table_name}`")
-
-        # Retrieve the UserLongTermMemory table name from the environment variables.
-        user_long_term_memory_table_name = self.get_env_var(
-            "USER_LONG_TERM_MEMORY_TABLE_NAME"
-        )
-        user_long_term_memory_bo = UserLongTermMemoryBO(
-            table_name=user_long_term_memory_table_name
-        )
-
-        # Fetch the user long-term memory content using the user_id
         user_id = self.body.get("cbf_user_uuid")
 
         if not user_id:
             raise ValueError("user_id is required")
 
-        user_long_term_memory = user_long_term_memory_bo.get_last_memory(
-            user_id=user_id
+        # The app behaviour and the user long-term memory are independent,
+        # so both lookups run concurrently to pay a single round trip.
+        app_behaviour_future = _EXECUTOR.submit(
+            _APP_BEHAVIOUR_BO.get_behaviour_content, app_id=app_id
         )
+        user_long_term_memory_future = _EXECUTOR.submit(
+            _USER_LONG_TERM_MEMORY_BO.get_last_memory, user_id=user_id
+        )
+        app_behaviour = app_behaviour_future.result()
+        user_long_term_memory = user_long_term_memory_future.result()
+
+        if not app_behaviour:
+            raise ValueError(f"AppBehaviour not found for app_id: {app_id}.\n"
+                             f"You must add it in the table `{_APP_BEHAVIOUR_TABLE_NAME}`")
 
         last_memory_content = None
+        last_memory_version = 0
 
         if user_long_term_memory:
-            last_memory_content = user_long_term_memory["memory"]
+            last_memory_content = user_long_term_memory.memory
+            last_memory_version = user_long_term_memory.version
 
         # Include the retrieved app behaviour in the response payload.
-        payload = {
-            **self.body,
-            "app_behaviour": app_behaviour,
-            "user_long_term_memory": last_memory_content,
-        }
+        # self.body belongs to BaseLambdaHandler, so it is copied, not mutated.
+        payload = dict(self.body)
+        payload["app_behaviour"] = app_behaviour
+        payload["user_long_term_memory"] = last_memory_content
+        # Lets the memory updater write without reading the memory again.
+        payload["user_long_term_memory_version"] = last_memory_version
 
         # Publish the response to the custom event bus.
         self.publish_to_custom_event_bus(
@@ -102,6 +108,9 @@ class ContextRetriever(BaseLambdaHandler):
         return payload
 
 
+_HANDLER = ContextRetriever()
+
+
 def handler(event, context):
     """
     Lambda entry point for handling context retrieval requests.
@@ -110,8 +119,7 @@ def handler(event, context):
     :param context: The runtime information for the Lambda function.
     :return: The result from processing the event.
     """
-    _handler = ContextRetriever()
     # Implicitly invokes __call__(), which:
     #   - Executes _do_the_job(), which:
     #       - Calls before_handle(), handle(), and after_handle() methods.
-    return _handler(event, context)
+    return _HANDLER(event, context)
@@ -2,10 +2,14 @@
 This module contains the business logic for the UserLongTermMemory entity.
 """
 
-from functools import lru_cache
 import time
 
-from app_common.dynamodb_utils import DynamoDBBase
+from boto3.dynamodb.types import TypeDeserializer
+
+from shared_clients import DYNAMODB_CLIENT
+
+# Decodes the items read through the low-level client.
+_DESERIALIZER = TypeDeserializer()
 
 
 class UserLongTermMemory:
@@ -13,16 +17,24 @@ class UserLongTermMemory:
     Represents an UserLongTermMemory entity.
     """
 
-    def __init__(self, user_id: str, memory: str) -> None:
+    def __init__(
+        self, user_id: str, memory: str, timestamp: int = None, version: int = 0
+    ) -> None:
         """
         Initializes an instance of the UserLongTermMemory class.
 
         :param user_id: Identifier for the user.
         :param memory: the user memory register.
+        :param timestamp: Creation time in epoch seconds; defaults to now.
+        :param version: Number of writes of the user's memory, this one
+            included; 0 for a memory that was never stored.
         """
         self.user_id = user_id
-        self.timestamp = int(time.time())
+        if timestamp is None:
+            timestamp = time.time_ns() // 1_000_000_000
+        self.timestamp = timestamp
         self.memory = memory
+        self.version = version
 
     def to_dict(self) -> dict:
         """
@@ -34,36 +46,128 @@ class UserLongTermMemory:
             "user_id": self.user_id,
             "timestamp": self.timestamp,
             "memory": self.memory,
+            "version": self.version,
         }
 
 
-class UserLongTermMemoryBO(DynamoDBBase):
+class UserLongTermMemoryBO:
     """
     Business object for managing UserLongTermMemory entities.
     """
 
-    @lru_cache
-    def get_last_memory(self, user_id: str) -> UserLongTermMemory:
+    def __init__(self, table_name: str) -> None:
+        """
+        Initializes the business object for the specified table.
+
+        :param table_name: Name of the DynamoDB table.
+        """
+        # All requests go through the plain client, so no Table resource is
+        # needed, only its name.
+        self._table_name = table_name
+
+    def get_last_memory(
+        self, user_id: str, consistent_read: bool = False
+    ) -> UserLongTermMemory:
         """
-        Retrieves the behaviour content for the specified application.
+        Retrieves the last memory of the specified user.
 
-        :param user_id: Identifier for the application.
+        :param user_id: Identifier for the user.
+        :param consistent_read: Whether the read must reflect every write
+            acknowledged before it, as needed before a conditional update.
         :return: Memory as a UserLongTermMemory object, or None if not found.
         """
-        response = self._get_last_items_by_key(
-            key_name="user_id", key_value=user_id, k=1
+        # The table is keyed by user_id only and every update overwrites the
+        # user's item, so the stored item is always the last memory.
+        response = DYNAMODB_CLIENT.get_item(
+            TableName=self._table_name,
+            Key={"user_id": {"S": user_id}},
+            ConsistentRead=consistent_read,
         )
-        if not response:  # response is expected to be a list
+        item = response.get("Item")
+        if not item:  # the user has no memory yet
             return None
-        # else: there is memory
-        return response[0]
 
-    def add_memory(self, user_id: str, memory: str) -> UserLongTermMemory:
+        return self._to_memory(item)
+
+    def add_memory(
+        self, user_id: str, memory: str, expected_version: int
+    ) -> UserLongTermMemory:
         """
-        Adds a new memory for the specified user.
+        Adds a new memory for the specified user, replacing the given version.
 
         :param user_id: Identifier for the user.
         :param memory: the user memory register.
+        :param expected_version: Version of the memory the new one was built
+            from, 0 if the user had none; the write only succeeds if that
+            version is still the stored one.
+        :return: The stored memory as a UserLongTermMemory object, or None if
+            a different memory was stored in the meantime.
         """
-        user_memory = UserLongTermMemory(user_id, memory)
-        return self.add(user_memory)
+        user_memory = UserLongTermMemory(
+            user_id, memory, version=expected_version + 1
+        )
+        # The item is written already in DynamoDB's wire format through the
+        # plain client, skipping the resource layer's type serializer.
+        put_item_kwargs = {
+            "TableName": self._table_name,
+            "Item": {
+                "user_id": {"S": user_memory.user_id},
+                "timestamp": {"N": str(user_memory.timestamp)},
+                "memory": {"S": user_memory.memory},
+                "version": {"N": str(user_memory.version)},
+            },
+            "ExpressionAttributeNames": {"#v": "version"},
+            # Lets a failed check tell a conflicting write from our own.
+            "ReturnValuesOnConditionCheckFailure": "ALL_OLD",
+        }
+        if expected_version:
+            put_item_kwargs["ConditionExpression"] = "#v = :prev"
+            put_item_kwargs["ExpressionAttributeValues"] = {
+                ":prev": {"N": str(expected_version)}
+            }
+        else:
+            # First memory of the user. Items stored before the version
+            # counter was introduced count as version 0.
+            put_item_kwargs["ConditionExpression"] = (
+                "attribute_not_exists(user_id) OR attribute_not_exists(#v)"
+            )
+
+        try:
+            DYNAMODB_CLIENT.put_item(**put_item_kwargs)
+        except DYNAMODB_CLIENT.exceptions.ConditionalCheckFailedException as e:
+            stored_item = e.response.get("Item")
+            if not stored_item:
+                return None
+
+            stored_memory = self._to_memory(stored_item)
+            # botocore retries a write whose response timed out; if the first
+            # attempt was applied, the retry fails against our own item.
+            if (
+                stored_memory.version == user_memory.version
+                and stored_memory.memory == user_memory.memory
+            ):
+                return stored_memory
+
+            return None
+
+        return user_memory
+
+    @staticmethod
+    def _to_memory(item: dict) -> UserLongTermMemory:
+        """
+        Decodes an item in DynamoDB's wire format.
+
+        :param item: Item in DynamoDB's wire format.
+        :return: The memory as a UserLongTermMemory object.
+        """
+        item = {
+            name: _DESERIALIZER.deserialize(value) for name, value in item.items()
+        }
+        # Numbers are decoded as Decimal, which is not JSON serializable.
+        timestamp = item.get("timestamp")
+        return UserLongTermMemory(
+            user_id=item["user_id"],
+            memory=item.get("memory"),
+            timestamp=int(timestamp) if timestamp is not None else None,
+            version=int(item.get("version", 0)),
+        )
@@ -7,51 +7,43 @@ external services and utilities for AI processing, logging, and database interac
 """
 
 import json
+import operator
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 # Add `lambda/create/packages` to the system path.
 # This must be done before importing any modules from the `packages` directory.
-sys.path.append(os.path.join(os.path.dirname(__file__), "packages"))
+_PACKAGES_DIR = os.path.join(os.path.dirname(__file__), "packages")
+if _PACKAGES_DIR not in sys.path:
+    sys.path.append(_PACKAGES_DIR)
 
-from app_common.app_utils import http_request
 from long_memory_bo import UserLongTermMemoryBO
-from app_common.base_lambda_handler import BaseLambdaHandler
+from reusable_handler import ReusableLambdaHandler
+from shared_clients import http_request
 from app_common.exceptions_utils import NonUserFacingException
 
+# Fields the event body must carry, in the order _handle unpacks them.
+_REQUIRED_FIELDS = ("cbf_user_uuid", "user_message", "bot_message")
+_get_required_fields = operator.itemgetter(*_REQUIRED_FIELDS)
 
-class LongMemoryUpdater(BaseLambdaHandler):
-    """
-    A Lambda handler for updating the long-term memory of a user
-    based on the interaction between a user and a chatbot.
-    """
+# Summaries written per event before giving up on concurrent updates.
+_MAX_UPDATE_ATTEMPTS = 2
 
-    def __gen_prompt_input_msg(
-        self, current_summary: str, user_message: str, chatbot_response: str
-    ) -> str:
-        """
-        Generate a prompt for the AI model based on the current summary,
-        the user's message, and the chatbot's response.
+# Worker thread for the SSM lookup that overlaps the memory read in
+# LongMemoryUpdater._handle.
+_EXECUTOR = ThreadPoolExecutor(max_workers=1)
 
-        :param current_summary: The existing conversation summary.
-        :param user_message: The latest message from the user.
-        :param chatbot_response: The chatbot's response to the user's message.
-        :return: A formatted string prompt for the AI model.
-        """
-        return f"""### Current Summary:
-        {current_summary}
-        
-        ### New Message:
-        User: {user_message}
-        Chatbot: {chatbot_response}"""
+# Environment is fixed for the container's lifetime; a missing variable
+# fails the init phase instead of every request.
+_AI_JOB_SERVICE_URL_SSM_FULL_PATH = os.environ["AI_JOB_SERVICE_URL_SSM_FULL_PATH"]
 
-    def __get_assistant_behaviour(self) -> str:
-        """
-        Provide the AI assistant's behavior instructions for updating the conversation summary.
+_USER_LONG_TERM_MEMORY_BO = UserLongTermMemoryBO(
+    table_name=os.environ["USER_LONG_TERM_MEMORY_TABLE_NAME"]
+)
 
-        :return: A string detailing the assistant's behavior and task.
-        """
-        return """You are an AI assistant responsible for maintaining a concise and accurate summary of a conversation.
+# Instructions given to the AI model for maintaining the conversation summary.
+_ASSISTANT_BEHAVIOUR = """You are an AI assistant responsible for maintaining a concise and accurate summary of a conversation.
         The summary should include ONLY ESSENTIAL facts, unresolved issues, user preferences, 
         user personal information, or other important details that improve future interactions.
 
@@ -64,61 +56,64 @@ class LongMemoryUpdater(BaseLambdaHandler):
         {{"summary": "<updated summary>"}}
         """
 
-    def _handle(self) -> dict:
-        """
-        Handle the incoming request to update the user's long-term memory.
-
-        :return: A dictionary containing the app behaviour and the original payload.
-        :raises ValueError: If required parameters are missing.
-        """
-        # Extract required data from the event body
-        user_id = self.body.get("cbf_user_uuid")
-        if not user_id:
-            raise ValueError("cbf_user_uuid is required")
-
-        user_msg = self.body.get("user_message")
-        if not user_msg:
-            raise ValueError("user_message is required")
+# Prompt sent to the AI model: the current summary followed by the latest
+# user and chatbot messages.
+_PROMPT_TEMPLATE = """### Current Summary:
+        {current_summary}
+        
+        ### New Message:
+        User: {user_message}
+        Chatbot: {chatbot_response}"""
 
-        bot_msg = self.body.get("bot_message")
-        if not bot_msg:
-            raise ValueError("bot_message is required")
 
-        # Retrieve the UserLongTermMemory table name from the environment variables
-        user_long_term_memory_table_name = self.get_env_var(
-            "USER_LONG_TERM_MEMORY_TABLE_NAME"
-        )
-        user_long_term_memory_bo = UserLongTermMemoryBO(
-            table_name=user_long_term_memory_table_name
-        )
+class LongMemoryUpdater(ReusableLambdaHandler):
+    """
+    A Lambda handler for updating the long-term memory of a user
+    based on the interaction between a user and a chatbot.
+    """
 
-        last_memory_content = self.body.get("user_long_term_memory")
+    def _summarize(
+        self,
+        ai_job_service_url: str,
+        current_summary: str,
+        user_msg: str,
+        bot_msg: str,
+    ) -> str:
+        """
+        Ask the AI job service for the summary updated with the latest messages.
 
+        :param ai_job_service_url: URL of the AI job service.
+        :param current_summary: The existing conversation summary.
+        :param user_msg: The latest message from the user.
+        :param bot_msg: The chatbot's response to the user's message.
+        :return: The updated summary.
+        :raises RuntimeError: If the AI job service returns no output.
+        :raises NonUserFacingException: If the output is not valid JSON or
+            carries no summary text.
+        """
         # Prepare the AI job payload
         ai_job = {
             "category": "text-based",
             "input": {
-                "text": self.__gen_prompt_input_msg(
-                    current_summary=last_memory_content,
+                "text": _PROMPT_TEMPLATE.format(
+                    current_summary=current_summary,
                     user_message=user_msg,
                     chatbot_response=bot_msg,
                 ),
-                "assistant_behaviour": self.__get_assistant_behaviour(),
+                "assistant_behaviour": _ASSISTANT_BEHAVIOUR,
             },
         }
 
-        # Retrieve the AI job service URL from an SSM parameter
-        ai_job_service_url = self.get_ssm_parameter_cached(
-            self.get_env_var("AI_JOB_SERVICE_URL_SSM_FULL_PATH")
-        )
-
         # Send the payload to the AI job service and get the response
         ai_job_result = http_request(
             url=ai_job_service_url, method="POST", json_data=ai_job
         )
 
         # Extract the AI-generated summary from the response
-        if "body" not in ai_job_result or ai_job_result["body"].get("output") is None:
+        if (
+            not isinstance(ai_job_result.get("body"), dict)
+            or ai_job_result["body"].get("output") is None
+        ):
             raise RuntimeError(f"Error while processing the message: {ai_job_result}")
 
         ai_response = ai_job_result["body"]["output"]
@@ -134,12 +129,104 @@ class LongMemoryUpdater(BaseLambdaHandler):
                 f"Error while processing the message: {ai_job_result}"
             ) from e
 
-        new_memory_content = ai_job_result["summary"]
+        summary = None
+        if isinstance(ai_job_result, dict):
+            summary = ai_job_result.get("summary")
+
+        # Anything but text would be stored as a different attribute type.
+        if not isinstance(summary, str):
+            raise NonUserFacingException(
+                f"Error while processing the message: {ai_job_result}"
+            )
+
+        return summary
+
+    @staticmethod
+    def _read_last_memory(user_id: str) -> tuple:
+        """
+        Reads the stored memory of the user, as needed before a conditional
+        update of it.
 
-        # Update the user's long-term memory in the database
-        new_memory = user_long_term_memory_bo.add_memory(
-            user_id=user_id, memory=new_memory_content
+        :param user_id: Identifier for the user.
+        :return: The memory content and version; None and 0 if the user has
+            no memory yet.
+        """
+        last_memory = _USER_LONG_TERM_MEMORY_BO.get_last_memory(
+            user_id=user_id, consistent_read=True
         )
+        if last_memory is None:
+            return None, 0
+
+        return last_memory.memory, last_memory.version
+
+    def _handle(self) -> dict:
+        """
+        Handle the incoming request to update the user's long-term memory.
+
+        :return: A dictionary containing the app behaviour and the original payload.
+        :raises ValueError: If required parameters are missing.
+        :raises NonUserFacingException: If the memory keeps being replaced
+            concurrently.
+        """
+        # Extract required data from the event body
+        try:
+            user_id, user_msg, bot_msg = _get_required_fields(self.body)
+        except KeyError as e:
+            raise ValueError(f"{e.args[0]} is required") from None
+
+        if not (user_id and user_msg and bot_msg):
+            empty_field = next(f for f in _REQUIRED_FIELDS if not self.body[f])
+            raise ValueError(f"{empty_field} is required")
+
+        if "user_long_term_memory" in self.body:
+            # Forwarded by the context retriever: usually still the stored
+            # memory, which the conditional write below verifies.
+            last_memory_content = self.body["user_long_term_memory"]
+            last_memory_version = self.body.get("user_long_term_memory_version", 0)
+            # Get the AI job service URL from the SSM parameter
+            ai_job_service_url = self.get_ssm_parameter_cached(
+                _AI_JOB_SERVICE_URL_SSM_FULL_PATH
+            )
+        else:
+            # Not forwarded by the caller: read it from the database. The
+            # SSM lookup does not depend on it, so it runs meanwhile.
+            ai_job_service_url_future = _EXECUTOR.submit(
+                self.get_ssm_parameter_cached, _AI_JOB_SERVICE_URL_SSM_FULL_PATH
+            )
+            last_memory_content, last_memory_version = self._read_last_memory(
+                user_id
+            )
+            ai_job_service_url = ai_job_service_url_future.result()
+
+        for attempt in range(_MAX_UPDATE_ATTEMPTS):
+            if attempt:
+                # Another update replaced the memory the summary was built
+                # from: summarize once more on top of the stored one.
+                last_memory_content, last_memory_version = self._read_last_memory(
+                    user_id
+                )
+
+            new_memory_content = self._summarize(
+                ai_job_service_url=ai_job_service_url,
+                current_summary=last_memory_content,
+                user_msg=user_msg,
+                bot_msg=bot_msg,
+            )
+
+            # Update the user's long-term memory in the database, unless
+            # another update has replaced the memory this summary was built
+            # from.
+            new_memory = _USER_LONG_TERM_MEMORY_BO.add_memory(
+                user_id=user_id,
+                memory=new_memory_content,
+                expected_version=last_memory_version,
+            )
+            if new_memory is not None:
+                break
+        else:
+            raise NonUserFacingException(
+                f"Concurrent updates of the memory of user {user_id}"
+            )
 
         payload = {
             "app_id": self.body.get("app_id"),
@@ -158,6 +245,10 @@ class LongMemoryUpdater(BaseLambdaHandler):
 
         return payload
 
+
+_HANDLER = LongMemoryUpdater()
+
+
 def handler(event, context):
     """
     Lambda entry point for handling context retrieval requests.
@@ -166,6 +257,5 @@ def handler(event, context):
     :param context: The runtime information for the Lambda function.
     :return: The result from processing the event.
     """
-    _handler = LongMemoryUpdater()
     # Invokes the BaseLambdaHandler logic chain
-    return _handler(event, context)
+    return _HANDLER(event, context)
@@ -0,0 +1,32 @@
+"""
+This module contains the base class of the Lambda handlers that are created
+once per container and reused by its invocations.
+"""
+
+from app_common.base_lambda_handler import BaseLambdaHandler
+
+# Attributes BaseLambdaHandler binds to the request being processed.
+_REQUEST_ATTRIBUTES = ("event", "body")
+
+
+class ReusableLambdaHandler(BaseLambdaHandler):
+    """
+    Base class for Lambda handlers serving several invocations.
+
+    The request state of the previous invocation is cleared before each
+    call, so none of it can leak into the next request, whatever parts of
+    it BaseLambdaHandler rebinds.
+    """
+
+    def __call__(self, event, context):
+        """
+        Processes an invocation, starting from a clean request state.
+
+        :param event: The event data passed to the Lambda function.
+        :param context: The runtime information for the Lambda function.
+        :return: The result from processing the event.
+        """
+        for name in _REQUEST_ATTRIBUTES:
+            setattr(self, name, None)
+
+        return super().__call__(event, context)
@@ -0,0 +1,95 @@
+"""
+This module holds the AWS and HTTP clients shared by the Lambda functions.
+
+The clients are created once, when the module is imported during the Lambda
+init phase, so warm invocations served by the same container reuse the open
+connections instead of paying a new TCP/TLS handshake on every request.
+"""
+
+import json
+from functools import lru_cache
+
+import boto3
+import urllib3
+from botocore.config import Config
+
+# Keep the sockets alive between invocations and let botocore adapt the
+# retry rate to throttling instead of hammering DynamoDB. The short timeouts
+# abandon a stalled request and retry it rather than waiting for the 60 s
+# socket default; item reads and writes normally complete in a few ms.
+_DYNAMODB_CONFIG = Config(
+    tcp_keepalive=True,
+    max_pool_connections=10,
+    connect_timeout=0.5,
+    read_timeout=0.5,
+    retries={"max_attempts": 3, "mode": "adaptive"},
+)
+
+DYNAMODB = boto3.resource("dynamodb", config=_DYNAMODB_CONFIG)
+# Plain client for requests written in DynamoDB's wire format. The resource's
+# meta.client cannot be used for them: the resource registers its type
+# (de)serializer on it, which would encode the attribute values again.
+DYNAMODB_CLIENT = boto3.client("dynamodb", config=_DYNAMODB_CONFIG)
+
+# Pooled HTTP connections, kept open between invocations. Transient gateway
+# errors are retried for idempotent methods only (urllib3 never retries POST).
+# The error retries are capped per kind rather than with "total", which would
+# also cap the redirects followed.
+HTTP = urllib3.PoolManager(
+    num_pools=4,
+    maxsize=8,
+    timeout=urllib3.Timeout(connect=3.0, read=30.0),
+    retries=urllib3.Retry(
+        total=None,
+        connect=2,
+        read=2,
+        status=2,
+        redirect=5,
+        backoff_factor=0.1,
+        status_forcelist=[502, 503, 504],
+        raise_on_status=False,
+    ),
+)
+
+
+@lru_cache(maxsize=None)
+def get_table(table_name: str):
+    """
+    Retrieves the DynamoDB Table resource for the specified table.
+
+    boto3 builds the Table class from the service model every time a table
+    resource is requested, so it is done once per table and container.
+
+    :param table_name: Name of the DynamoDB table.
+    :return: The boto3 Table resource.
+    """
+    return DYNAMODB.Table(table_name)
+
+
+def http_request(
+    method: str, url: str, json_data: dict = None, decode_json: bool = True
+) -> dict:
+    """
+    Sends an HTTP request through the shared connection pool.
+
+    :param method: HTTP method, e.g. "GET" or "POST".
+    :param url: URL to send the request to.
+    :param json_data: Optional payload, sent as a JSON request body.
+    :param decode_json: Whether JSON response bodies are decoded; when
+                        False, the body is always returned as text.
+    :return: Dictionary with the response "status_code" and "body"; JSON
+             bodies are decoded, any other content is returned as text.
+    """
+    body = None
+    headers = None
+    if json_data is not None:
+        body = json.dumps(json_data).encode("utf-8")
+        headers = {"Content-Type": "application/json"}
+
+    response = HTTP.request(method, url, body=body, headers=headers)
+    body = response.data.decode("utf-8", errors="replace")
+    content_type = response.headers.get("Content-Type", "")
+    if decode_json and content_type.startswith("application/json"):
+        body = json.loads(body)
+
+    return {"status_code": response.status, "body": body}
@@ -0,0 +1,22 @@
+"""
+This module contains the base class of the business objects backed by a
+single DynamoDB table.
+"""
+
+from shared_clients import get_table
+
+
+class TableBO:
+    """
+    Base class for business objects stored in one DynamoDB table.
+    """
+
+    def __init__(self, table_name: str) -> None:
+        """
+        Initializes the business object for the specified table.
+
+        :param table_name: Name of the DynamoDB table.
+        """
+        # Bound to the shared resource, so the connection pool outlives
+        # the invocation.
+        self._table = get_table(table_name)
@@ -0,0 +1,64 @@
+"""
+This module contains a small in-process cache whose entries expire after a
+fixed time-to-live.
+"""
+
+import threading
+import time
+
+
+class TTLCache:
+    """
+    A bounded key/value cache with per-entry expiration.
+
+    Instances are meant to live at module scope, so every warm invocation
+    served by the same Lambda container shares the cached entries. Access is
+    guarded by a lock, as handlers may call the cache from worker threads.
+    """
+
+    def __init__(self, ttl: float, maxsize: int = 1024) -> None:
+        """
+        Initializes an empty cache.
+
+        :param ttl: Number of seconds an entry stays valid after being set.
+        :param maxsize: Maximum number of entries; the oldest are evicted first.
+        """
+        self._ttl = ttl
+        self._maxsize = maxsize
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """
+        Retrieves the value cached for the specified key.
+
+        :param key: Key of the entry.
+        :return: The cached value, or None if missing or expired.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            expires_at, value = entry
+            if time.monotonic() >= expires_at:
+                del self._entries[key]
+                return None
+
+            return value
+
+    def set(self, key, value) -> None:
+        """
+        Caches a value for the specified key, evicting the oldest entries
+        when the cache is full.
+
+        :param key: Key of the entry.
+        :param value: Value to cache.
+        """
+        with self._lock:
+            # Re-insert so the entry moves to the end of the eviction order.
+            self._entries.pop(key, None)
+            self._entries[key] = (time.monotonic() + self._ttl, value)
+
+            while len(self._entries) > self._maxsize:
+                del self._entries[next(iter(self._entries))]
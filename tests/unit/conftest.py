@@ -0,0 +1,11 @@
+import os
+import sys
+
+# The Lambda modules import each other as top-level modules, as they do once
+# deployed, so their directory must be importable.
+LAMBDAS_DIR = os.path.join(os.path.dirname(__file__), "..", "..", "lambdas")
+sys.path.insert(0, os.path.abspath(LAMBDAS_DIR))
+
+# shared_clients creates its boto3 resource at import time, which needs a
+# region even though no request is sent.
+os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
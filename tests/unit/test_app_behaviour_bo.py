@@ -0,0 +1,35 @@
+from unittest import mock
+
+import app_behaviour_bo
+from urllib3.exceptions import MaxRetryError
+
+
+def test_unreachable_url_behaviour_yields_none():
+    bo = app_behaviour_bo.AppBehaviourBO("AppBehaviourTable")
+    error = MaxRetryError(None, "https://behaviour.test/doc", "timed out")
+
+    with mock.patch.object(app_behaviour_bo, "http_request", side_effect=error):
+        assert bo._load_url_content_as_text("https://behaviour.test/doc") is None
+
+
+def test_failed_url_behaviour_yields_none():
+    bo = app_behaviour_bo.AppBehaviourBO("AppBehaviourTable")
+    response = {"status_code": 404, "body": "not found"}
+
+    with mock.patch.object(app_behaviour_bo, "http_request", return_value=response):
+        assert bo._load_url_content_as_text("https://behaviour.test/missing") is None
+
+
+def test_url_behaviour_is_loaded_as_text():
+    bo = app_behaviour_bo.AppBehaviourBO("AppBehaviourTable")
+    response = {"status_code": 200, "body": '{"persona": "helpful"}'}
+
+    with mock.patch.object(
+        app_behaviour_bo, "http_request", return_value=response
+    ) as http_request:
+        content = bo._load_url_content_as_text("https://behaviour.test/doc.json")
+
+    assert content == '{"persona": "helpful"}'
+    http_request.assert_called_once_with(
+        "GET", "https://behaviour.test/doc.json", decode_json=False
+    )
@@ -0,0 +1,165 @@
+import pytest
+import shared_clients
+from botocore.stub import ANY, Stubber
+from long_memory_bo import UserLongTermMemoryBO
+
+TABLE_NAME = "UserLongTermMemoryTable"
+
+
+@pytest.fixture
+def memory_bo():
+    return UserLongTermMemoryBO(TABLE_NAME)
+
+
+@pytest.fixture
+def stubber():
+    with Stubber(shared_clients.DYNAMODB_CLIENT) as stubber:
+        yield stubber
+        stubber.assert_no_pending_responses()
+
+
+def _item(memory, version=None):
+    item = {
+        "user_id": {"S": "user-1"},
+        "memory": memory,
+        "timestamp": {"N": "1700000000"},
+    }
+    if version is not None:
+        item["version"] = {"N": str(version)}
+    return item
+
+
+def _put_item_params(memory, version, condition, values=None):
+    params = {
+        "TableName": TABLE_NAME,
+        "Item": {
+            "user_id": {"S": "user-1"},
+            "timestamp": {"N": ANY},
+            "memory": {"S": memory},
+            "version": {"N": str(version)},
+        },
+        "ConditionExpression": condition,
+        "ExpressionAttributeNames": {"#v": "version"},
+        "ReturnValuesOnConditionCheckFailure": "ALL_OLD",
+    }
+    if values:
+        params["ExpressionAttributeValues"] = values
+    return params
+
+
+def test_get_last_memory_decodes_item(memory_bo, stubber):
+    stubber.add_response(
+        "get_item",
+        {"Item": _item({"S": "likes tea"}, version=7)},
+        {
+            "TableName": TABLE_NAME,
+            "Key": {"user_id": {"S": "user-1"}},
+            "ConsistentRead": True,
+        },
+    )
+
+    memory = memory_bo.get_last_memory("user-1", consistent_read=True)
+
+    assert memory.to_dict() == {
+        "user_id": "user-1",
+        "timestamp": 1700000000,
+        "memory": "likes tea",
+        "version": 7,
+    }
+    assert type(memory.timestamp) is int
+    assert type(memory.version) is int
+
+
+def test_get_last_memory_tolerates_null_memory_and_no_version(memory_bo, stubber):
+    stubber.add_response("get_item", {"Item": _item({"NULL": True})})
+
+    memory = memory_bo.get_last_memory("user-1")
+
+    assert memory.memory is None
+    assert memory.version == 0
+
+
+def test_get_last_memory_without_item_returns_none(memory_bo, stubber):
+    stubber.add_response("get_item", {})
+
+    assert memory_bo.get_last_memory("user-1") is None
+
+
+def test_first_memory_requires_no_versioned_item(memory_bo, stubber):
+    stubber.add_response(
+        "put_item",
+        {},
+        _put_item_params(
+            "x", 1, "attribute_not_exists(user_id) OR attribute_not_exists(#v)"
+        ),
+    )
+
+    memory = memory_bo.add_memory("user-1", "x", expected_version=0)
+
+    assert (memory.memory, memory.version) == ("x", 1)
+
+
+def test_update_requires_expected_version(memory_bo, stubber):
+    stubber.add_response(
+        "put_item",
+        {},
+        _put_item_params("x", 4, "#v = :prev", {":prev": {"N": "3"}}),
+    )
+
+    memory = memory_bo.add_memory("user-1", "x", expected_version=3)
+
+    assert (memory.memory, memory.version) == ("x", 4)
+
+
+def test_conflicting_write_returns_none(memory_bo, stubber):
+    stubber.add_client_error(
+        "put_item",
+        service_error_code="ConditionalCheckFailedException",
+        modeled_fields={"Item": _item({"S": "other"}, version=4)},
+    )
+
+    assert memory_bo.add_memory("user-1", "x", expected_version=3) is None
+
+
+def test_retried_write_that_already_succeeded_is_not_a_conflict(memory_bo, stubber):
+    stubber.add_client_error(
+        "put_item",
+        service_error_code="ConditionalCheckFailedException",
+        modeled_fields={"Item": _item({"S": "x"}, version=4)},
+    )
+
+    memory = memory_bo.add_memory("user-1", "x", expected_version=3)
+
+    assert (memory.memory, memory.version) == ("x", 4)
+
+
+class _Sent(Exception):
+    pass
+
+
+def test_get_last_memory_sends_wire_format_key(memory_bo):
+    sent = []
+
+    def capture(params, **kwargs):
+        sent.append(params["body"])
+        raise _Sent
+
+    # Serialized request, before it is signed and sent.
+    event_name = "before-call.dynamodb.GetItem"
+    events = shared_clients.DYNAMODB_CLIENT.meta.events
+    events.register_first(event_name, capture)
+    try:
+        with pytest.raises(_Sent):
+            memory_bo.get_last_memory("user-1")
+    finally:
+        events.unregister(event_name, capture)
+
+    assert b'"Key": {"user_id": {"S": "user-1"}}' in sent[0]
+
+
+def test_bo_does_not_build_a_table_resource():
+    shared_clients.get_table.cache_clear()
+
+    UserLongTermMemoryBO(TABLE_NAME)
+
+    assert shared_clients.get_table.cache_info().currsize == 0
@@ -0,0 +1,177 @@
+from unittest import mock
+
+import pytest
+
+
+@pytest.fixture
+def updater_module(monkeypatch):
+    # The module reads its configuration from the environment at import time.
+    monkeypatch.setenv("USER_LONG_TERM_MEMORY_TABLE_NAME", "UserLongTermMemoryTable")
+    monkeypatch.setenv("AI_JOB_SERVICE_URL_SSM_FULL_PATH", "/global/NewAIJobAPIURL")
+    import long_memory_updater
+
+    return long_memory_updater
+
+
+def _ai_job_result(summary: str) -> dict:
+    return {"status_code": 200, "body": {"output": f'{{"summary": "{summary}"}}'}}
+
+
+@pytest.fixture
+def handler(updater_module):
+    handler = updater_module.LongMemoryUpdater()
+    handler.body = {
+        "app_id": "app-1",
+        "cbf_user_uuid": "user-1",
+        "user_message": "hi",
+        "bot_message": "hello",
+        "user_long_term_memory": "previous summary",
+        "user_long_term_memory_version": 3,
+    }
+    with mock.patch.object(
+        handler, "get_ssm_parameter_cached", return_value="https://ai-job.test"
+    ), mock.patch.object(
+        handler, "publish_to_custom_event_bus"
+    ), mock.patch.object(
+        handler, "do_log"
+    ):
+        yield handler
+
+
+def test_summary_is_extracted_from_ai_output(updater_module, handler):
+    from long_memory_bo import UserLongTermMemory
+
+    with mock.patch.object(
+        updater_module, "http_request", return_value=_ai_job_result("x")
+    ), mock.patch.object(
+        updater_module, "_USER_LONG_TERM_MEMORY_BO"
+    ) as memory_bo:
+        memory_bo.add_memory.return_value = UserLongTermMemory(
+            "user-1", "x", timestamp=0, version=4
+        )
+        payload = handler._handle()
+
+    # The forwarded memory is used as is: a single DynamoDB request.
+    memory_bo.get_last_memory.assert_not_called()
+    memory_bo.add_memory.assert_called_once_with(
+        user_id="user-1", memory="x", expected_version=3
+    )
+    assert payload == {
+        "app_id": "app-1",
+        "user_id": "user-1",
+        "timestamp": 0,
+        "memory": "x",
+        "version": 4,
+    }
+    handler.get_ssm_parameter_cached.assert_called_once_with("/global/NewAIJobAPIURL")
+
+
+def test_memory_is_read_when_not_forwarded(updater_module, handler):
+    from long_memory_bo import UserLongTermMemory
+
+    del handler.body["user_long_term_memory"]
+    del handler.body["user_long_term_memory_version"]
+
+    with mock.patch.object(
+        updater_module, "http_request", return_value=_ai_job_result("x")
+    ), mock.patch.object(
+        updater_module, "_USER_LONG_TERM_MEMORY_BO"
+    ) as memory_bo:
+        memory_bo.get_last_memory.return_value = None
+        memory_bo.add_memory.return_value = UserLongTermMemory(
+            "user-1", "x", version=1
+        )
+        handler._handle()
+
+    memory_bo.get_last_memory.assert_called_once_with(
+        user_id="user-1", consistent_read=True
+    )
+    memory_bo.add_memory.assert_called_once_with(
+        user_id="user-1", memory="x", expected_version=0
+    )
+    handler.get_ssm_parameter_cached.assert_called_once_with("/global/NewAIJobAPIURL")
+
+
+def test_conflict_summarizes_the_newer_memory_again(updater_module, handler):
+    from long_memory_bo import UserLongTermMemory
+
+    with mock.patch.object(
+        updater_module,
+        "http_request",
+        side_effect=[_ai_job_result("first"), _ai_job_result("second")],
+    ) as http_request, mock.patch.object(
+        updater_module, "_USER_LONG_TERM_MEMORY_BO"
+    ) as memory_bo:
+        memory_bo.get_last_memory.return_value = UserLongTermMemory(
+            "user-1", "newer", version=4
+        )
+        stored_memory = UserLongTermMemory("user-1", "second", version=5)
+        memory_bo.add_memory.side_effect = [None, stored_memory]
+        payload = handler._handle()
+
+    memory_bo.get_last_memory.assert_called_once_with(
+        user_id="user-1", consistent_read=True
+    )
+    first_prompt = http_request.call_args_list[0].kwargs["json_data"]["input"]["text"]
+    assert "previous summary" in first_prompt
+    assert memory_bo.add_memory.call_args_list == [
+        mock.call(user_id="user-1", memory="first", expected_version=3),
+        mock.call(user_id="user-1", memory="second", expected_version=4),
+    ]
+    retry_prompt = http_request.call_args_list[1].kwargs["json_data"]["input"]["text"]
+    assert "newer" in retry_prompt
+    assert payload["memory"] == "second"
+    assert payload["version"] == 5
+
+
+def test_repeated_conflicts_give_up(updater_module, handler):
+    from app_common.exceptions_utils import NonUserFacingException
+    from long_memory_bo import UserLongTermMemory
+
+    with mock.patch.object(
+        updater_module, "http_request", return_value=_ai_job_result("x")
+    ), mock.patch.object(
+        updater_module, "_USER_LONG_TERM_MEMORY_BO"
+    ) as memory_bo:
+        memory_bo.get_last_memory.return_value = UserLongTermMemory(
+            "user-1", "newer", version=4
+        )
+        memory_bo.add_memory.return_value = None
+        with pytest.raises(NonUserFacingException):
+            handler._handle()
+
+    assert memory_bo.add_memory.call_count == 2
+    handler.publish_to_custom_event_bus.assert_not_called()
+
+
+def test_non_text_summary_is_rejected(updater_module, handler):
+    from app_common.exceptions_utils import NonUserFacingException
+
+    ai_job_result = {"status_code": 200, "body": {"output": '{"summary": ["x"]}'}}
+
+    with mock.patch.object(updater_module, "http_request", return_value=ai_job_result):
+        with pytest.raises(NonUserFacingException):
+            handler._summarize("https://ai-job.test", "previous summary", "hi", "hello")
+
+
+def test_handler_does_not_carry_request_state_over(updater_module):
+    from app_common.base_lambda_handler import BaseLambdaHandler
+
+    seen = []
+
+    def base_call(self, event, context):
+        # Records what the base class finds, then binds only the event, as a
+        # base class that leaves a missing body unset would.
+        seen.append((self.event, self.body))
+        self.event = event
+        if "body" in event:
+            self.body = event["body"]
+        return self.body
+
+    with mock.patch.object(BaseLambdaHandler, "__call__", base_call):
+        first = updater_module.handler({"body": {"cbf_user_uuid": "user-1"}}, None)
+        second = updater_module.handler({"detail": {}}, None)
+
+    assert first == {"cbf_user_uuid": "user-1"}
+    assert second is None
+    assert seen == [(None, None), (None, None)]
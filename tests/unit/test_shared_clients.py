@@ -0,0 +1,60 @@
+from unittest import mock
+
+import shared_clients
+
+
+def _response(data: bytes, content_type: str, status: int = 200):
+    return mock.Mock(status=status, data=data, headers={"Content-Type": content_type})
+
+
+def test_http_request_decodes_json_body():
+    response = _response(b'{"output": "x"}', "application/json; charset=utf-8")
+    with mock.patch.object(shared_clients, "HTTP") as http:
+        http.request.return_value = response
+        result = shared_clients.http_request("POST", "https://test", {"a": 1})
+
+    assert result == {"status_code": 200, "body": {"output": "x"}}
+    http.request.assert_called_once_with(
+        "POST",
+        "https://test",
+        body=b'{"a": 1}',
+        headers={"Content-Type": "application/json"},
+    )
+
+
+def test_http_request_returns_other_bodies_as_text():
+    response = _response(b'{"not": "parsed"}', "text/plain", status=404)
+    with mock.patch.object(shared_clients, "HTTP") as http:
+        http.request.return_value = response
+        result = shared_clients.http_request("GET", "https://test")
+
+    assert result == {"status_code": 404, "body": '{"not": "parsed"}'}
+    http.request.assert_called_once_with(
+        "GET", "https://test", body=None, headers=None
+    )
+
+
+def test_http_request_replaces_undecodable_bytes():
+    response = _response(b"caf\xe9", "text/plain")
+    with mock.patch.object(shared_clients, "HTTP") as http:
+        http.request.return_value = response
+        result = shared_clients.http_request("GET", "https://test")
+
+    assert result["body"] == "caf�"
+
+
+def test_http_pool_follows_more_redirects_than_error_retries():
+    retries = shared_clients.HTTP.connection_pool_kw["retries"]
+
+    assert retries.total is None
+    assert retries.redirect == 5
+    assert (retries.connect, retries.read, retries.status) == (2, 2, 2)
+
+
+def test_http_request_can_leave_json_bodies_as_text():
+    response = _response(b'{"not": "parsed"', "application/json")
+    with mock.patch.object(shared_clients, "HTTP") as http:
+        http.request.return_value = response
+        result = shared_clients.http_request("GET", "https://test", decode_json=False)
+
+    assert result == {"status_code": 200, "body": '{"not": "parsed"'}
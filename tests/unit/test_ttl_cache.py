@@ -0,0 +1,53 @@
+from unittest import mock
+
+from ttl_cache import TTLCache
+
+
+def test_get_returns_value_until_expiry():
+    cache = TTLCache(ttl=10)
+    with mock.patch("ttl_cache.time.monotonic", return_value=100.0):
+        cache.set("key", "value")
+
+    with mock.patch("ttl_cache.time.monotonic", return_value=109.9):
+        assert cache.get("key") == "value"
+
+    with mock.patch("ttl_cache.time.monotonic", return_value=110.0):
+        assert cache.get("key") is None
+
+
+def test_get_missing_key_returns_none():
+    assert TTLCache(ttl=10).get("missing") is None
+
+
+def test_oldest_entry_is_evicted_when_full():
+    cache = TTLCache(ttl=10, maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.set("c", 3)
+
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+    assert cache.get("c") == 3
+
+
+def test_set_again_moves_entry_to_end_of_eviction_order():
+    cache = TTLCache(ttl=10, maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.set("a", 10)
+    cache.set("c", 3)
+
+    assert cache.get("a") == 10
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+
+def test_set_again_refreshes_expiry():
+    cache = TTLCache(ttl=10)
+    with mock.patch("ttl_cache.time.monotonic", return_value=100.0):
+        cache.set("key", "old")
+    with mock.patch("ttl_cache.time.monotonic", return_value=105.0):
+        cache.set("key", "new")
+
+    with mock.patch("ttl_cache.time.monotonic", return_value=112.0):
+        assert cache.get("key") == "new"